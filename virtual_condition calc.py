@@ -1,38 +1,316 @@
+import math
+import os
 import sys
+from functools import lru_cache, partial
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton,
-    QGridLayout, QFileDialog, QComboBox, QMessageBox,
-    QTableWidget, QTableWidgetItem, QVBoxLayout, QHBoxLayout, QHeaderView
+    QGridLayout, QFileDialog, QComboBox, QMessageBox, QAbstractItemView,
+    QTableView, QVBoxLayout, QHBoxLayout, QHeaderView
 )
-from PyQt5.QtCore import Qt, QRegExp
-from PyQt5.QtGui import QDoubleValidator, QRegExpValidator, QPalette, QColor
-import pandas as pd
+from PyQt5.QtCore import (
+    Qt, QLocale, QRegularExpression, QTimer, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+    QThreadPool, pyqtSignal, pyqtSlot
+)
+from PyQt5.QtGui import QDoubleValidator, QRegularExpressionValidator, QPalette, QColor
+import numpy as np
+
+_LETTER_RE = QRegularExpression(r"^[A-Za-z]$")
+
+_STYLESHEET = """
+    QLineEdit, QComboBox {
+        background-color: #2c2c2c;
+        color: white;
+        border: 1px solid #555;
+        padding: 4px;
+        border-radius: 4px;
+    }
+    QLineEdit:focus, QComboBox:focus {
+        border: 2px solid #00bc8c;
+        background-color: #3a3a3a;
+    }
+    QLabel {
+        color: white;
+    }
+    QTableView {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        gridline-color: #555;
+    }
+    QHeaderView::section {
+        background-color: #333;
+        color: white;
+        padding: 4px;
+        border: 1px solid #444;
+    }
+"""
+
+_VC_PERCENTS = (75, 80, 90, 100)
+_VC_PCTS = np.array([0.75, 0.80, 0.90, 1.00])
+_VC_TEMPLATES = tuple(f"VC @ {pct}%: {{:.3f}}" for pct in _VC_PERCENTS)
+_VC_BLANKS = tuple(f"VC @ {pct}%: —" for pct in _VC_PERCENTS)
+
+EXPORT_HEADERS = (
+    "Nominal Size", "Upper Limit (+)", "Lower Limit (-)",
+    "Position Tolerance", "Feature Type", "Datum",
+    "VC @ 75%", "VC @ 80%", "VC @ 90%", "VC @ 100%"
+)
+# Exports larger than this are split into name_part1.xlsx, name_part2.xlsx, ...
+SEGMENT_SIZE = 250_000
+
+
+@lru_cache(maxsize=128)
+def _compute_vc(nominal, lower, tolerance, is_pin):
+    mmc_size = nominal - lower if is_pin else nominal + lower
+    vc_vals = mmc_size - tolerance * _VC_PCTS
+    # Cached results are shared between callers, so keep them immutable
+    vc_vals.flags.writeable = False
+    return mmc_size, vc_vals
+
+
+def _set_if_changed(label, text):
+    # setText invalidates layout and repaints even when the text is identical
+    if label.text() != text:
+        label.setText(text)
+
+
+def _write_xlsx(path, floats, strs):
+    # Imported here so startup does not pay for it unless the user saves
+    import xlsxwriter
+
+    # constant_memory streams each row to disk instead of holding the workbook;
+    # nan_inf_to_errors writes any non-finite value as an Excel error cell rather than failing
+    workbook = xlsxwriter.Workbook(
+        path, {"constant_memory": True, "nan_inf_to_errors": True})
+    worksheet = workbook.add_worksheet()
+    worksheet.write_row(0, 0, EXPORT_HEADERS)
+    for r, (float_row, str_row) in enumerate(zip(floats, strs), 1):
+        worksheet.write_row(r, 0, float_row[:4])
+        worksheet.write_row(r, 4, str_row)
+        worksheet.write_row(r, 6, float_row[4:])
+    workbook.close()
+
+
+def _write_xlsx_segments(path, floats, strs):
+    if len(floats) <= SEGMENT_SIZE:
+        _write_xlsx(path, floats, strs)
+        return [path]
+    base, ext = os.path.splitext(path)
+    paths = []
+    for i, start in enumerate(range(0, len(floats), SEGMENT_SIZE)):
+        part_path = f"{base}_part{i + 1}{ext}"
+        stop = start + SEGMENT_SIZE
+        _write_xlsx(part_path, floats[start:stop], strs[start:stop])
+        paths.append(part_path)
+    return paths
+
+
+class ExportSignals(QObject):
+    finished = pyqtSignal(list, int)
+    failed = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    """Writes a snapshot of the entries to Excel on a QThreadPool worker."""
+
+    def __init__(self, floats, strs, path):
+        super().__init__()
+        self.floats = floats
+        self.strs = strs
+        self.path = path
+        self.signals = ExportSignals()
+
+    def run(self):
+        try:
+            paths = _write_xlsx_segments(self.path, self.floats, self.strs)
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+        else:
+            self.signals.finished.emit(paths, len(self.floats))
+
+
+class EntryModel(QAbstractTableModel):
+    HEADERS = [
+        "Nominal Size", "Upper Limit (+)", "Lower Limit (-)",
+        "position Tolerance", "Feature Type", "Datum",
+        "VC @ 75%", "VC @ 80%", "VC @ 90%", "VC @ 100%"
+    ]
+    FLOAT_COLS = (0, 1, 2, 3, 6, 7, 8, 9)
+    STR_COLS = (4, 5)
+    # Display format per column; fixed precision keeps cell text, and so column widths, stable
+    COL_FMTS = (".4f", ".4f", ".4f", ".4f", "", "", ".3f", ".3f", ".3f", ".3f")
+
+    # Emitted with (row, col) when an edited numeric cell is not a number
+    editRejected = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Preallocated storage grown by doubling; only the first _len rows are live
+        self._cap = 64
+        self._len = 0
+        self._floats = np.empty((self._cap, len(self.FLOAT_COLS)), dtype=np.float64)
+        self._strs = np.empty((self._cap, len(self.STR_COLS)), dtype=object)
+
+    def _cell(self, row, col):
+        if col in self.STR_COLS:
+            return self._strs[row, self.STR_COLS.index(col)]
+        return self._floats[row, self.FLOAT_COLS.index(col)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._len
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._cell(index.row(), index.column())
+            fmt = self.COL_FMTS[index.column()]
+            return format(value, fmt) if fmt else str(value)
+        if role == Qt.EditRole:
+            # Edit the stored value at full precision, not the rounded display text
+            return str(self._cell(index.row(), index.column()))
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        # Re-committing the text the editor was opened with is a no-op
+        if value == str(self._cell(row, col)):
+            return False
+        if col in self.STR_COLS:
+            self._strs[row, self.STR_COLS.index(col)] = value
+        else:
+            try:
+                number = float(value)
+                if not math.isfinite(number):
+                    raise ValueError(value)
+            except ValueError:
+                self.editRejected.emit(row, col)
+                return False
+            self._floats[row, self.FLOAT_COLS.index(col)] = number
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        n = self._len
+        if not n:
+            return
+        if column in self.STR_COLS:
+            keys = self._strs[:n, self.STR_COLS.index(column)]
+        else:
+            keys = self._floats[:n, self.FLOAT_COLS.index(column)]
+        perm = np.argsort(keys, kind="stable")
+        if order == Qt.DescendingOrder:
+            perm = perm[::-1]
+
+        self.layoutAboutToBeChanged.emit()
+        self._floats[:n] = self._floats[:n][perm]
+        self._strs[:n] = self._strs[:n][perm]
+        new_rows = np.empty_like(perm)
+        new_rows[perm] = np.arange(len(perm))
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [
+            self.index(int(new_rows[idx.row()]), idx.column()) for idx in old_indexes
+        ])
+        self.layoutChanged.emit()
+
+    def _grow(self):
+        self._cap *= 2
+        floats = np.empty((self._cap, self._floats.shape[1]), dtype=np.float64)
+        strs = np.empty((self._cap, self._strs.shape[1]), dtype=object)
+        floats[:self._len] = self._floats[:self._len]
+        strs[:self._len] = self._strs[:self._len]
+        self._floats, self._strs = floats, strs
+
+    def append_entry(self, entry):
+        row = self._len
+        if row == self._cap:
+            self._grow()
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._floats[row] = [entry[c] for c in self.FLOAT_COLS]
+        self._strs[row] = [entry[c] for c in self.STR_COLS]
+        self._len += 1
+        self.endInsertRows()
+
+    def remove_entry(self, row):
+        n = self._len
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._floats[row:n - 1] = self._floats[row + 1:n]
+        self._strs[row:n - 1] = self._strs[row + 1:n]
+        self._strs[n - 1] = None
+        self._len -= 1
+        self.endRemoveRows()
+
+    def snapshot(self):
+        """Return copies of the live (floats, strs) rows, safe to hand to another thread."""
+        return self._floats[:self._len].copy(), self._strs[:self._len].copy()
+
 
 class VirtualConditionCalculator(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Virtual Condition Calculator")
-        self.entries = []
+        self.model = EntryModel(self)
+
+        # Inputs of the last recompute, so unchanged inputs skip it
+        self._vc_cache_key = None
+
+        # Parsed field values, refreshed only by the field that changed (None = not a number)
+        self._v_nominal = 0.0
+        self._v_upper = 0.0
+        self._v_lower = 0.0
+        self._v_tolerance = 0.0
+        self._v_is_pin = True
+
+        # Debounce live recalculation so a burst of keystrokes recomputes once
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(50)
+        self._recalc_timer.timeout.connect(self._do_calculate)
+
         self.init_ui()
 
+        # Clears the transient "Added entry" message
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(1500)
+        self._status_timer.timeout.connect(self.status_label.clear)
+
     def init_ui(self):
-        validator = QDoubleValidator()
-        letter_validator = QRegExpValidator(QRegExp("[A-Za-z]"))
+        # One validator per kind, shared by the fields; the C locale matches what float() parses
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.RejectGroupSeparator)
+        self._double_validator = QDoubleValidator(self)
+        self._double_validator.setLocale(locale)
+        self._letter_validator = QRegularExpressionValidator(_LETTER_RE, self)
 
         main_layout = QVBoxLayout()
         form_layout = QGridLayout()
 
         self.nominal_input = QLineEdit()
-        self.nominal_input.setValidator(validator)
+        self.nominal_input.setValidator(self._double_validator)
         self.upper_limit_input = QLineEdit()
-        self.upper_limit_input.setValidator(validator)
+        self.upper_limit_input.setValidator(self._double_validator)
         self.lower_limit_input = QLineEdit()
-        self.lower_limit_input.setValidator(validator)
+        self.lower_limit_input.setValidator(self._double_validator)
         self.tolerance_input = QLineEdit()
-        self.tolerance_input.setValidator(validator)
+        self.tolerance_input.setValidator(self._double_validator)
         self.datum_input = QLineEdit()
         self.datum_input.setMaxLength(1)
-        self.datum_input.setValidator(letter_validator)
+        self.datum_input.setValidator(self._letter_validator)
 
         self.feature_type = QComboBox()
         self.feature_type.addItems(["Pin Size", "Hole Size"])
@@ -46,16 +324,17 @@ class VirtualConditionCalculator(QWidget):
         self.feature_type.activated.connect(self.focus_add_button)
 
         # Live update
-        for field in [self.nominal_input, self.upper_limit_input,
-                      self.lower_limit_input, self.tolerance_input]:
+        for name, field in [("nominal", self.nominal_input),
+                            ("upper", self.upper_limit_input),
+                            ("lower", self.lower_limit_input),
+                            ("tolerance", self.tolerance_input)]:
+            field.textChanged.connect(partial(self._parse_field, name))
             field.textChanged.connect(self.calculate_virtual_condition)
+        self.feature_type.currentIndexChanged.connect(self._set_feature_type)
         self.feature_type.currentIndexChanged.connect(self.calculate_virtual_condition)
 
         # Labels
-        self.vc_75 = QLabel("VC @ 75%: ")
-        self.vc_80 = QLabel("VC @ 80%: ")
-        self.vc_90 = QLabel("VC @ 90%: ")
-        self.vc_100 = QLabel("VC @ 100%: ")
+        self._vc_labels = [QLabel(f"VC @ {pct}%: ") for pct in _VC_PERCENTS]
 
         form_layout.addWidget(QLabel("Nominal Size"), 0, 0)
         form_layout.addWidget(self.nominal_input, 0, 1)
@@ -70,10 +349,8 @@ class VirtualConditionCalculator(QWidget):
         form_layout.addWidget(QLabel("Feature Type"), 5, 0)
         form_layout.addWidget(self.feature_type, 5, 1)
 
-        form_layout.addWidget(self.vc_75, 6, 0, 1, 2)
-        form_layout.addWidget(self.vc_80, 7, 0, 1, 2)
-        form_layout.addWidget(self.vc_90, 8, 0, 1, 2)
-        form_layout.addWidget(self.vc_100, 9, 0, 1, 2)
+        for row, label in enumerate(self._vc_labels, 6):
+            form_layout.addWidget(label, row, 0, 1, 2)
 
         btn_layout = QHBoxLayout()
         self.add_btn = QPushButton("Add Entry")
@@ -84,157 +361,147 @@ class VirtualConditionCalculator(QWidget):
         delete_btn.clicked.connect(self.delete_selected_entry)
         delete_btn.setStyleSheet("background-color: #e74c3c; color: white; font-weight: bold;")
 
-        save_btn = QPushButton("Save All to Excel")
-        save_btn.clicked.connect(self.save_results_to_excel)
-        save_btn.setStyleSheet("background-color: #3498db; color: white; font-weight: bold;")
+        self.save_btn = QPushButton("Save All to Excel")
+        self.save_btn.clicked.connect(self.save_results_to_excel)
+        self.save_btn.setStyleSheet("background-color: #3498db; color: white; font-weight: bold;")
 
         btn_layout.addWidget(self.add_btn)
         btn_layout.addWidget(delete_btn)
-        btn_layout.addWidget(save_btn)
-
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            "Nominal Size", "Upper Limit (+)", "Lower Limit (-)",
-            "position Tolerance", "Feature Type", "Datum",
-            "VC @ 75%", "VC @ 80%", "VC @ 90%", "VC @ 100%"
-        ])
-        self.table.setEditTriggers(QTableWidget.DoubleClicked)
+        btn_layout.addWidget(self.save_btn)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setEditTriggers(QAbstractItemView.DoubleClicked)
         self.table.setSortingEnabled(True)
-        self.table.cellChanged.connect(self.edit_table_entry)
+        self.model.editRejected.connect(self.edit_table_entry)
 
-        # Force column size to show "Specified Tolerance"
+        # Interactive rather than ResizeToContents, which re-measures every row on each change;
+        # the 150 px minimum keeps the headers and typical values readable
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setResizeContentsPrecision(100)
         header.setMinimumSectionSize(150)
 
+        self.status_label = QLabel()
+
         main_layout.addLayout(form_layout)
         main_layout.addLayout(btn_layout)
+        main_layout.addWidget(self.status_label)
         main_layout.addWidget(QLabel("Stored Entries:"))
         main_layout.addWidget(self.table)
 
         self.setLayout(main_layout)
 
-        self.setStyleSheet("""
-            QLineEdit, QComboBox {
-                background-color: #2c2c2c;
-                color: white;
-                border: 1px solid #555;
-                padding: 4px;
-                border-radius: 4px;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border: 2px solid #00bc8c;
-                background-color: #3a3a3a;
-            }
-            QLabel {
-                color: white;
-            }
-            QTableWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                gridline-color: #555;
-            }
-            QHeaderView::section {
-                background-color: #333;
-                color: white;
-                padding: 4px;
-                border: 1px solid #444;
-            }
-        """)
-
+    @pyqtSlot()
     def focus_add_button(self):
         self.add_btn.setFocus()
 
+    @pyqtSlot()
     def calculate_virtual_condition(self):
+        self._recalc_timer.start()
+
+    def _parse_field(self, name, text):
         try:
-            self.nominal = float(self.nominal_input.text() or 0)
-            self.upper = float(self.upper_limit_input.text() or 0)
-            self.lower = float(self.lower_limit_input.text() or 0)
-            self.tolerance = float(self.tolerance_input.text() or 0)
-            feature_type = self.feature_type.currentText()
-
-            self.mmc_size = (
-                self.nominal - self.lower if feature_type == "Pin Size"
-                else self.nominal + self.lower
-            )
-
-            self.vc_75_val = self.mmc_size - self.tolerance * 0.75
-            self.vc_80_val = self.mmc_size - self.tolerance * 0.80
-            self.vc_90_val = self.mmc_size - self.tolerance * 0.90
-            self.vc_100_val = self.mmc_size - self.tolerance * 1.00
-
-            self.vc_75.setText(f"VC @ 75%: {self.vc_75_val:.3f}")
-            self.vc_80.setText(f"VC @ 80%: {self.vc_80_val:.3f}")
-            self.vc_90.setText(f"VC @ 90%: {self.vc_90_val:.3f}")
-            self.vc_100.setText(f"VC @ 100%: {self.vc_100_val:.3f}")
+            value = float(text) if text else 0.0
         except ValueError:
-            self.vc_75.setText("VC @ 75%: —")
-            self.vc_80.setText("VC @ 80%: —")
-            self.vc_90.setText("VC @ 90%: —")
-            self.vc_100.setText("VC @ 100%: —")
+            value = None
+        if value is not None and not math.isfinite(value):
+            # e.g. "1e400" passes the validator as Intermediate but overflows to inf
+            value = None
+        setattr(self, "_v_" + name, value)
+
+    @pyqtSlot(int)
+    def _set_feature_type(self, index):
+        self._v_is_pin = index == 0
+
+    @pyqtSlot()
+    def _do_calculate(self):
+        values = (self._v_nominal, self._v_upper, self._v_lower, self._v_tolerance)
+        key = values + (self._v_is_pin,)
+        if key == self._vc_cache_key:
+            return
+        self._vc_cache_key = key
 
-    def add_entry(self):
-        try:
-            self.calculate_virtual_condition()
-            datum = self.datum_input.text().upper() or "-"
-            entry = [
-                self.nominal, self.upper, self.lower, self.tolerance,
-                self.feature_type.currentText(), datum,
-                round(self.vc_75_val, 3), round(self.vc_80_val, 3),
-                round(self.vc_90_val, 3), round(self.vc_100_val, 3)
-            ]
-            self.entries.append(entry)
-            self.update_table()
-            QMessageBox.information(self, "Entry Added", "Entry successfully added.")
-        except AttributeError:
-            QMessageBox.warning(self, "Invalid Data", "Please fill all fields properly.")
+        if None in values:
+            for label, blank in zip(self._vc_labels, _VC_BLANKS):
+                _set_if_changed(label, blank)
+            return
+
+        self.nominal, self.upper, self.lower, self.tolerance = values
+        self.mmc_size, self._vc_vals = _compute_vc(
+            self.nominal, self.lower, self.tolerance, self._v_is_pin)
 
-    def update_table(self):
-        self.table.blockSignals(True)
-        self.table.setRowCount(len(self.entries))
-        for row, entry in enumerate(self.entries):
-            for col, value in enumerate(entry):
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, col, item)
-        self.table.blockSignals(False)
+        for label, template, value in zip(self._vc_labels, _VC_TEMPLATES, self._vc_vals):
+            _set_if_changed(label, template.format(value))
 
+    @pyqtSlot()
+    def add_entry(self):
+        self._recalc_timer.stop()
+        self._do_calculate()
+        if None in (self._v_nominal, self._v_upper, self._v_lower, self._v_tolerance):
+            QMessageBox.warning(self, "Invalid Data", "Please fill all fields properly.")
+            return
+        datum = self.datum_input.text().upper() or "-"
+        entry = [
+            self.nominal, self.upper, self.lower, self.tolerance,
+            self.feature_type.currentText(), datum,
+            *(round(float(value), 3) for value in self._vc_vals)
+        ]
+        self.table.setUpdatesEnabled(False)
+        self.model.append_entry(entry)
+        if self.model.rowCount() == 1:
+            # Size columns once; later rows rely on the 150 px minimum section size, and the
+            # user can widen a column by hand if a much larger value needs more room
+            self.table.resizeColumnsToContents()
+        self.table.setUpdatesEnabled(True)
+        self.status_label.setText("Added entry #%d" % self.model.rowCount())
+        self._status_timer.start()
+
+    @pyqtSlot()
     def delete_selected_entry(self):
-        selected = self.table.currentRow()
+        selected = self.table.currentIndex().row()
         if selected >= 0:
-            self.entries.pop(selected)
-            self.update_table()
+            self.model.remove_entry(selected)
         else:
             QMessageBox.warning(self, "No Selection", "Please select a row to delete.")
 
+    @pyqtSlot(int, int)
     def edit_table_entry(self, row, col):
-        try:
-            new_value = self.table.item(row, col).text()
-            if col in [0, 1, 2, 3, 6, 7, 8, 9]:
-                new_value = float(new_value)
-            self.entries[row][col] = new_value
-        except ValueError:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
-            self.update_table()
+        # The model has already refused the edit; just tell the user why
+        QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
 
+    @pyqtSlot()
     def save_results_to_excel(self):
-        if not self.entries:
+        if not self.model.rowCount():
             QMessageBox.warning(self, "No Entries", "Add entries before saving.")
             return
         save_path, _ = QFileDialog.getSaveFileName(self, "Save All Entries", "", "Excel Files (*.xlsx)")
         if save_path:
-            df = pd.DataFrame(self.entries, columns=[
-                "Nominal Size", "Upper Limit (+)", "Lower Limit (-)",
-                "Position Tolerance", "Feature Type", "Datum",
-                "VC @ 75%", "VC @ 80%", "VC @ 90%", "VC @ 100%"
-            ])
-            df.to_excel(save_path, index=False)
-            QMessageBox.information(self, "Saved", f"{len(self.entries)} entries saved.")
+            floats, strs = self.model.snapshot()
+            task = ExportTask(floats, strs, save_path)
+            task.signals.finished.connect(self._on_export_done)
+            task.signals.failed.connect(self._on_export_failed)
+            self.save_btn.setEnabled(False)
+            QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot(list, int)
+    def _on_export_done(self, paths, count):
+        self.save_btn.setEnabled(True)
+        if len(paths) > 1:
+            QMessageBox.information(
+                self, "Saved", f"{count} entries saved across {len(paths)} files.")
+        else:
+            QMessageBox.information(self, "Saved", f"{count} entries saved.")
+
+    @pyqtSlot(str)
+    def _on_export_failed(self, message):
+        self.save_btn.setEnabled(True)
+        QMessageBox.warning(self, "Save Failed", message)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     QApplication.setStyle("Fusion")
+    app.setStyleSheet(_STYLESHEET)
 
     dark_palette = QPalette()
     dark_palette.setColor(QPalette.Window, QColor(30, 30, 30))